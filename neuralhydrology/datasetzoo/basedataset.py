@@ -1,10 +1,12 @@
+import itertools
 import logging
 import pickle
 import re
 import sys
 import warnings
-from collections import defaultdict
-from typing import List, Dict, Union
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Iterator, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -207,6 +209,31 @@ class BaseDataset(Dataset):
         """This function has to return the attributes in a basin-indexed DataFrame."""
         raise NotImplementedError
 
+    def _iterate_basin_data(self) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """Yield the basin ids and their data, loaded in parallel threads if `num_loading_threads` is larger than 1."""
+        if self.cfg.num_loading_threads > 1:
+            # only keep a limited number of basins in flight, so that loaded basin data does not pile up in memory if
+            # the threads load basins faster than they are consumed.
+            basins = iter(self.basins)
+            max_pending = 2 * self.cfg.num_loading_threads
+            with ThreadPoolExecutor(max_workers=self.cfg.num_loading_threads) as executor:
+                pending = deque((basin, executor.submit(self._load_basin_data, basin))
+                                for basin in itertools.islice(basins, max_pending))
+                try:
+                    while pending:
+                        basin, future = pending.popleft()
+                        next_basin = next(basins, None)
+                        if next_basin is not None:
+                            pending.append((next_basin, executor.submit(self._load_basin_data, next_basin)))
+                        yield basin, future.result()
+                finally:
+                    # don't wait for basins that will never be consumed, e.g. if loading or processing failed
+                    for _, future in pending:
+                        future.cancel()
+        else:
+            for basin in self.basins:
+                yield basin, self._load_basin_data(basin)
+
     def _create_id_to_int(self):
         self.id_to_int = {str(b): i for i, b in enumerate(np.random.permutation(self.basins))}
 
@@ -326,8 +353,10 @@ class BaseDataset(Dataset):
 
             if not self._disable_pbar:
                 LOGGER.info("Loading basin data into xarray data set.")
-            for basin in tqdm(self.basins, disable=self._disable_pbar, file=sys.stdout):
-                df = self._load_basin_data(basin)
+            for basin, df in tqdm(self._iterate_basin_data(),
+                                  total=len(self.basins),
+                                  disable=self._disable_pbar,
+                                  file=sys.stdout):
 
                 # add columns from dataframes passed as additional data files
                 df = pd.concat([df, *[d[basin] for d in self.additional_features]], axis=1)
@@ -137,8 +137,9 @@ def load_camels_aus_attributes(data_dir: Path, basins: List[str] = []) -> pd.Dat
     df["end_date"] = pd.to_datetime(df["end_date"], format="%Y%m%d")
 
     if basins:
-        if any(b not in df.index for b in basins):
-            raise ValueError('Some basins are missing static attributes.')
+        missing_basins = [b for b in basins if b not in df.index]
+        if missing_basins:
+            raise ValueError(f'Some basins are missing static attributes: {missing_basins}')
         df = df.loc[basins]
 
     return df
@@ -138,8 +138,9 @@ def load_camels_cl_attributes(data_dir: Path, basins: List[str] = []) -> pd.Data
     df["record_period_end"] = pd.to_datetime(df["record_period_end"])
 
     if basins:
-        if any(b not in df.index for b in basins):
-            raise ValueError('Some basins are missing static attributes.')
+        missing_basins = [b for b in basins if b not in df.index]
+        if missing_basins:
+            raise ValueError(f'Some basins are missing static attributes: {missing_basins}')
         df = df.loc[basins]
 
     return df
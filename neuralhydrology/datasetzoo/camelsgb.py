@@ -117,8 +117,9 @@ def load_camels_gb_attributes(data_dir: Path, basins: List[str] = []) -> pd.Data
     df = pd.concat(dfs, axis=1)
 
     if basins:
-        if any(b not in df.index for b in basins):
-            raise ValueError('Some basins are missing static attributes.')
+        missing_basins = [b for b in basins if b not in df.index]
+        if missing_basins:
+            raise ValueError(f'Some basins are missing static attributes: {missing_basins}')
         df = df.loc[basins]
 
     return df
@@ -8,6 +8,9 @@ import xarray
 from neuralhydrology.datasetzoo.basedataset import BaseDataset
 from neuralhydrology.utils.config import Config
 
+# index of basin files per (directory, file suffix), filled and refreshed by _get_basin_file()
+_BASIN_FILE_INDEX: Dict[Tuple[Path, str], Dict[str, Path]] = {}
+
 
 class CamelsUS(BaseDataset):
     """Data set class for the CAMELS US data set by [#]_ and [#]_.
@@ -74,17 +77,17 @@ class CamelsUS(BaseDataset):
 
             # rename columns
             if len(self.cfg.forcings) > 1:
-                df = df.rename(columns={col: f"{col}_{forcing}" for col in df.columns})
+                df = df.add_suffix(f"_{forcing}")
             dfs.append(df)
-        df = pd.concat(dfs, axis=1)
+        df = dfs[0] if len(dfs) == 1 else pd.concat(dfs, axis=1)
 
         # add discharge
         df['QObs(mm/d)'] = load_camels_us_discharge(self.cfg.data_dir, basin, area)
 
         # replace invalid discharge values by NaNs
         qobs_cols = [col for col in df.columns if "qobs" in col.lower()]
-        for col in qobs_cols:
-            df.loc[df[col] < 0, col] = np.nan
+        if qobs_cols:
+            df[qobs_cols] = df[qobs_cols].where(df[qobs_cols] >= 0)
 
         return df
 
@@ -123,21 +126,20 @@ def load_camels_us_attributes(data_dir: Path, basins: List[str] = []) -> pd.Data
     txt_files = attributes_path.glob('camels_*.txt')
 
     # Read-in attributes into one big dataframe
-    dfs = []
-    for txt_file in txt_files:
-        df_temp = pd.read_csv(txt_file, sep=';', header=0, dtype={'gauge_id': str})
-        df_temp = df_temp.set_index('gauge_id')
-
-        dfs.append(df_temp)
-
+    dfs = [
+        pd.read_csv(txt_file, sep=';', header=0, dtype={'gauge_id': str}, index_col='gauge_id')
+        for txt_file in txt_files
+    ]
     df = pd.concat(dfs, axis=1)
+
     # convert huc column to double digit strings
-    df['huc'] = df['huc_02'].apply(lambda x: str(x).zfill(2))
+    df['huc'] = df['huc_02'].astype(str).str.zfill(2)
     df = df.drop('huc_02', axis=1)
 
     if basins:
-        if any(b not in df.index for b in basins):
-            raise ValueError('Some basins are missing static attributes.')
+        missing_basins = [b for b in basins if b not in df.index]
+        if missing_basins:
+            raise ValueError(f'Some basins are missing static attributes: {missing_basins}')
         df = df.loc[basins]
 
     return df
@@ -169,11 +171,7 @@ def load_camels_us_forcings(data_dir: Path, basin: str, forcings: str) -> Tuple[
     if not forcing_path.is_dir():
         raise OSError(f"{forcing_path} does not exist")
 
-    file_path = list(forcing_path.glob(f'**/{basin}_*_forcing_leap.txt'))
-    if file_path:
-        file_path = file_path[0]
-    else:
-        raise FileNotFoundError(f'No file for Basin {basin} at {file_path}')
+    file_path = _get_basin_file(forcing_path, '_forcing_leap.txt', basin)
 
     with open(file_path, 'r') as fp:
         # load area from header
@@ -181,11 +179,13 @@ def load_camels_us_forcings(data_dir: Path, basin: str, forcings: str) -> Tuple[
         fp.readline()
         area = int(fp.readline())
         # load the dataframe from the rest of the stream
-        df = pd.read_csv(fp, sep='\s+')
-        df["date"] = pd.to_datetime(df.Year.map(str) + "/" + df.Mnth.map(str) + "/" + df.Day.map(str),
-                                    format="%Y/%m/%d")
+        df = pd.read_csv(fp, sep=r'\s+', engine='c')
+        df["date"] = pd.to_datetime(dict(year=df.Year, month=df.Mnth, day=df.Day))
         df = df.set_index("date")
 
+    # single precision is sufficient for the meteorological variables and halves the memory footprint
+    df = df.astype({col: np.float32 for col in df.select_dtypes('float64').columns})
+
     return df, area
 
 
@@ -210,18 +210,48 @@ def load_camels_us_discharge(data_dir: Path, basin: str, area: int) -> pd.Series
     """
 
     discharge_path = data_dir / 'usgs_streamflow'
-    file_path = list(discharge_path.glob(f'**/{basin}_streamflow_qc.txt'))
-    if file_path:
-        file_path = file_path[0]
-    else:
-        raise FileNotFoundError(f'No file for Basin {basin} at {file_path}')
+    file_path = _get_basin_file(discharge_path, '_streamflow_qc.txt', basin)
 
     col_names = ['basin', 'Year', 'Mnth', 'Day', 'QObs', 'flag']
-    df = pd.read_csv(file_path, sep='\s+', header=None, names=col_names)
-    df["date"] = pd.to_datetime(df.Year.map(str) + "/" + df.Mnth.map(str) + "/" + df.Day.map(str), format="%Y/%m/%d")
+    col_dtypes = {
+        'basin': str,
+        'Year': np.int16,
+        'Mnth': np.int8,
+        'Day': np.int8,
+        'QObs': np.float64,
+        'flag': 'category'
+    }
+    df = pd.read_csv(file_path, sep=r'\s+', header=None, names=col_names, dtype=col_dtypes, engine='c')
+    df["date"] = pd.to_datetime(dict(year=df.Year, month=df.Mnth, day=df.Day))
     df = df.set_index("date")
 
     # normalize discharge from cubic feet per second to mm per day
-    df.QObs = 28316846.592 * df.QObs * 86400 / (area * 10**6)
+    # the conversion is done in double precision, only the result is stored in single precision
+    df.QObs = (28316846.592 * df.QObs * 86400 / (area * 10**6)).astype(np.float32)
 
     return df.QObs
+
+
+def _get_basin_file(directory: Path, suffix: str, basin: str) -> Path:
+    """Return the file of a basin in `directory` (or its subdirectories) whose name ends with `suffix`.
+
+    The directory tree is only traversed once per (directory, suffix) combination, instead of once per basin. It is
+    traversed again if the basin is not in the index or its indexed file no longer exists, i.e., if files were added,
+    moved, or deleted after the directory was indexed.
+    """
+    key = (directory, suffix)
+    file_path = _BASIN_FILE_INDEX.get(key, {}).get(basin)
+    if file_path is None or not file_path.is_file():
+        _BASIN_FILE_INDEX[key] = _index_basin_files(directory, suffix)
+        file_path = _BASIN_FILE_INDEX[key].get(basin)
+    if file_path is None:
+        raise FileNotFoundError(f'No file for Basin {basin} at {directory}')
+    return file_path
+
+
+def _index_basin_files(directory: Path, suffix: str) -> Dict[str, Path]:
+    """Map basin ids to the files in `directory` (and its subdirectories) whose names end with `suffix`."""
+    index = {}
+    for file_path in sorted(directory.glob(f'**/*{suffix}')):
+        index.setdefault(file_path.name.split('_')[0], file_path)
+    return index
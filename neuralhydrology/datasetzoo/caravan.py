@@ -137,8 +137,9 @@ def load_caravan_attributes(data_dir: Path,
     df = pd.concat(dfs, axis=0)
 
     if basins:
-        if any(b not in df.index for b in basins):
-            raise ValueError('Some basins are missing static attributes.')
+        missing_basins = [b for b in basins if b not in df.index]
+        if missing_basins:
+            raise ValueError(f'Some basins are missing static attributes: {missing_basins}')
         # Subset to only the requested basins.
         df = df.loc[basins]
 
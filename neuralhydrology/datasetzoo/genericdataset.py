@@ -145,8 +145,9 @@ def load_attributes(data_dir: Path, basins: List[str] = None) -> pd.DataFrame:
         df = pd.concat(dfs, axis=concat_axis, join='inner')
 
     if basins:
-        if any(b not in df.index for b in basins):
-            raise ValueError('Some basins are missing static attributes.')
+        missing_basins = [b for b in basins if b not in df.index]
+        if missing_basins:
+            raise ValueError(f'Some basins are missing static attributes: {missing_basins}')
         df = df.loc[basins]
 
     return df
@@ -102,8 +102,8 @@ class HourlyCamelsUS(camelsus.CamelsUS):
 
         # replace invalid discharge values by NaNs
         qobs_cols = [col for col in df.columns if 'qobs' in col.lower()]
-        for col in qobs_cols:
-            df.loc[df[col] < 0, col] = np.nan
+        if qobs_cols:
+            df[qobs_cols] = df[qobs_cols].where(df[qobs_cols] >= 0)
 
         # add stage, if requested
         if 'gauge_height_m' in self.cfg.target_variables:
@@ -257,8 +257,9 @@ def load_lamah_attributes(data_dir: Path, sub_dataset: str, basins: List[str] =
     df = pd.concat([df_catchment, df_gauge], axis=1)
 
     if basins:
-        if any(b not in df.index for b in basins):
-            raise ValueError('Some basins are missing static attributes.')
+        missing_basins = [b for b in basins if b not in df.index]
+        if missing_basins:
+            raise ValueError(f'Some basins are missing static attributes: {missing_basins}')
         df = df.loc[basins]
 
     return df
@@ -36,8 +36,7 @@ def load_hydroatlas_attributes(data_dir: Path, basins: List[str] = []) -> pd.Dat
     df = df.set_index('basin_id')
 
     if basins:
-        drop_basins = [b for b in df.index if b not in basins]
-        df = df.drop(drop_basins, axis=0)
+        df = df.loc[df.index.isin(basins)]
 
     return df
 
@@ -567,6 +567,10 @@ class Config(object):
     def no_loss_frequencies(self) -> list:
         return self._as_default_list(self._cfg.get("no_loss_frequencies", []))
 
+    @property
+    def num_loading_threads(self) -> int:
+        return self._cfg.get("num_loading_threads", 1)
+
     @property
     def num_workers(self) -> int:
         return self._cfg.get("num_workers", 0)
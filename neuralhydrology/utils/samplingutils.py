@@ -693,7 +693,7 @@ def bernoulli_subseries_sampler(
     if missing_fraction == 0:
         return data
     if missing_fraction == 1:
-        return np.full(data.shape, np.nan)
+        return np.full_like(data, np.nan)
 
     # Check that the input data is a 1-d timeseries.
     if not (data.ndim == 1 or (data.ndim == 2 and data.shape[-1] == 1)):
@@ -714,7 +714,7 @@ def bernoulli_subseries_sampler(
     off_shift_rate = on_shift_rate * missing_fraction / (1 - missing_fraction)
 
     # Initialize storage for the samples.
-    sampled_data = np.full(data.shape, np.nan)
+    sampled_data = np.full_like(data, np.nan)
     sampled_data[0] = data[0]
     if not start_sampling_on:
         sampled_data[0] = np.nan
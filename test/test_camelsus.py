@@ -0,0 +1,49 @@
+"""Unit tests for the CAMELS US data set helpers. """
+from pathlib import Path
+
+import pytest
+
+from neuralhydrology.datasetzoo.camelsus import _get_basin_file
+from test import Fixture
+
+
+def test_get_basin_file(tmpdir: Fixture[str]):
+    """Test the lookup of basin files, including files that are added after the directory was indexed. """
+    data_dir = Path(tmpdir)
+    (data_dir / '01').mkdir()
+    first_file = data_dir / '01' / '01022500_streamflow_qc.txt'
+    first_file.touch()
+
+    assert _get_basin_file(data_dir, '_streamflow_qc.txt', '01022500') == first_file
+
+    # basin that is not (yet) available
+    pytest.raises(FileNotFoundError, _get_basin_file, data_dir, '_streamflow_qc.txt', '01547700')
+
+    # files added after the first lookup have to be found as well
+    (data_dir / '02').mkdir()
+    second_file = data_dir / '02' / '01547700_streamflow_qc.txt'
+    second_file.touch()
+    assert _get_basin_file(data_dir, '_streamflow_qc.txt', '01547700') == second_file
+
+    # files with a different suffix are ignored
+    (data_dir / '02' / '02064000_lump_cida_forcing_leap.txt').touch()
+    pytest.raises(FileNotFoundError, _get_basin_file, data_dir, '_streamflow_qc.txt', '02064000')
+
+
+def test_get_basin_file_moved(tmpdir: Fixture[str]):
+    """Test that the lookup finds basin files that were moved after the directory was indexed. """
+    data_dir = Path(tmpdir)
+    for huc in ['01', '02']:
+        (data_dir / huc).mkdir()
+    old_file = data_dir / '01' / '01022500_streamflow_qc.txt'
+    old_file.touch()
+
+    assert _get_basin_file(data_dir, '_streamflow_qc.txt', '01022500') == old_file
+
+    new_file = data_dir / '02' / '01022500_streamflow_qc.txt'
+    old_file.rename(new_file)
+    assert _get_basin_file(data_dir, '_streamflow_qc.txt', '01022500') == new_file
+
+    # once the file is deleted, the lookup has to fail with a FileNotFoundError
+    new_file.unlink()
+    pytest.raises(FileNotFoundError, _get_basin_file, data_dir, '_streamflow_qc.txt', '01022500')
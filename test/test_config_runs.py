@@ -46,6 +46,43 @@ def test_daily_regression(get_config: Fixture[Callable[[str], dict]], single_tim
     _check_results(config, '01022500')
 
 
+def test_daily_regression_parallel_loading(get_config: Fixture[Callable[[str], dict]], tmpdir: Fixture[str]):
+    """Test that loading the basin data in multiple threads yields the same results as loading it sequentially.
+
+    Parameters
+    ----------
+    get_config : Fixture[Callable[[str], dict]]
+        Method that returns a run configuration
+    tmpdir : Fixture[str]
+        Name of the tmp directory in which the two runs are stored.
+    """
+    configs = []
+    for num_loading_threads in [1, 2]:
+        config = get_config('daily_regression')
+        config.update_config({
+            'dataset': 'camels_us',
+            'data_dir': config.data_dir / 'camels_us',
+            'forcings': 'daymet',
+            'dynamic_inputs': ['prcp(mm/day)', 'tmax(C)'],
+            'num_loading_threads': num_loading_threads
+        })
+        config.run_dir = Path(tmpdir) / f'threads_{num_loading_threads}'
+
+        start_training(config)
+        start_evaluation(cfg=config, run_dir=config.run_dir, epoch=1, period='test')
+        configs.append(config)
+
+    sequential_results = _get_basin_results(configs[0].run_dir, 1)
+    parallel_results = _get_basin_results(configs[1].run_dir, 1)
+
+    assert list(sequential_results.keys()) == list(parallel_results.keys())
+    for basin in sequential_results.keys():
+        sequential_xr = sequential_results[basin]['1D']['xr']
+        parallel_xr = parallel_results[basin]['1D']['xr']
+        for variable in ['QObs(mm/d)_obs', 'QObs(mm/d)_sim']:
+            assert sequential_xr[variable].values == approx(parallel_xr[variable].values, nan_ok=True)
+
+
 def test_daily_regression_additional_features(get_config: Fixture[Callable[[str], dict]]):
     """Tests #38 (training and testing with additional_features).
 
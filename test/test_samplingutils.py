@@ -0,0 +1,22 @@
+"""Unit tests for samplingutils functions. """
+import numpy as np
+import pytest
+
+from neuralhydrology.utils.samplingutils import bernoulli_subseries_sampler
+
+
+@pytest.mark.parametrize('dtype', [np.float32, np.float64])
+@pytest.mark.parametrize('missing_fraction', [0.0, 0.5, 1.0])
+def test_bernoulli_subseries_sampler_dtypes(dtype: type, missing_fraction: float):
+    """Test that the holdout sampler works for single and double precision inputs and preserves the dtype. """
+    data = np.arange(1000, dtype=dtype)
+
+    sampled_data = bernoulli_subseries_sampler(data=data, missing_fraction=missing_fraction, mean_missing_length=5.0)
+
+    assert sampled_data.dtype == dtype
+    assert sampled_data.shape == data.shape
+    # all values that were kept must be unchanged
+    kept = ~np.isnan(sampled_data)
+    assert (sampled_data[kept] == data[kept]).all()
+    if missing_fraction == 1.0:
+        assert not kept.any()